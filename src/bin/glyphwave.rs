@@ -1,5 +1,24 @@
 use std::env;
-use rand::Rng;
+use rand::distributions::{Distribution, Uniform};
+
+/// Combining diacritics (U+0300..=U+0362) sampled onto each input char.
+const COMBINING_CHARS: &[char] = &[
+    '\u{0300}', '\u{0301}', '\u{0302}', '\u{0303}', '\u{0304}', '\u{0305}', '\u{0306}', 
+    '\u{0307}', '\u{0308}', '\u{0309}', '\u{030A}', '\u{030B}', '\u{030C}', '\u{030D}', 
+    '\u{030E}', '\u{030F}', '\u{0310}', '\u{0311}', '\u{0312}', '\u{0313}', '\u{0314}', 
+    '\u{0315}', '\u{0316}', '\u{0317}', '\u{0318}', '\u{0319}', '\u{031A}', '\u{031B}', 
+    '\u{031C}', '\u{031D}', '\u{031E}', '\u{031F}', '\u{0320}', '\u{0321}', '\u{0322}', 
+    '\u{0323}', '\u{0324}', '\u{0325}', '\u{0326}', '\u{0327}', '\u{0328}', '\u{0329}', 
+    '\u{032A}', '\u{032B}', '\u{032C}', '\u{032D}', '\u{032E}', '\u{032F}', '\u{0330}', 
+    '\u{0331}', '\u{0332}', '\u{0333}', '\u{0334}', '\u{0335}', '\u{0336}', '\u{0337}', 
+    '\u{0338}', '\u{0339}', '\u{033A}', '\u{033B}', '\u{033C}', '\u{033D}', '\u{033E}', 
+    '\u{033F}', '\u{0340}', '\u{0341}', '\u{0342}', '\u{0343}', '\u{0344}', '\u{0345}', 
+    '\u{0346}', '\u{0347}', '\u{0348}', '\u{0349}', '\u{034A}', '\u{034B}', '\u{034C}', 
+    '\u{034D}', '\u{034E}', '\u{034F}', '\u{0350}', '\u{0351}', '\u{0352}', '\u{0353}', 
+    '\u{0354}', '\u{0355}', '\u{0356}', '\u{0357}', '\u{0358}', '\u{0359}', '\u{035A}', 
+    '\u{035B}', '\u{035C}', '\u{035D}', '\u{035E}', '\u{035F}', '\u{0360}', '\u{0361}', 
+    '\u{0362}'
+];
 
 fn main() {
     let args: Vec<String> = env::args().collect();
@@ -14,35 +33,20 @@ fn main() {
 }
 
 fn glyphwave(text: &str) -> String {
-    let combining_chars: &[char] = &[
-        '\u{0300}', '\u{0301}', '\u{0302}', '\u{0303}', '\u{0304}', '\u{0305}', '\u{0306}', 
-        '\u{0307}', '\u{0308}', '\u{0309}', '\u{030A}', '\u{030B}', '\u{030C}', '\u{030D}', 
-        '\u{030E}', '\u{030F}', '\u{0310}', '\u{0311}', '\u{0312}', '\u{0313}', '\u{0314}', 
-        '\u{0315}', '\u{0316}', '\u{0317}', '\u{0318}', '\u{0319}', '\u{031A}', '\u{031B}', 
-        '\u{031C}', '\u{031D}', '\u{031E}', '\u{031F}', '\u{0320}', '\u{0321}', '\u{0322}', 
-        '\u{0323}', '\u{0324}', '\u{0325}', '\u{0326}', '\u{0327}', '\u{0328}', '\u{0329}', 
-        '\u{032A}', '\u{032B}', '\u{032C}', '\u{032D}', '\u{032E}', '\u{032F}', '\u{0330}', 
-        '\u{0331}', '\u{0332}', '\u{0333}', '\u{0334}', '\u{0335}', '\u{0336}', '\u{0337}', 
-        '\u{0338}', '\u{0339}', '\u{033A}', '\u{033B}', '\u{033C}', '\u{033D}', '\u{033E}', 
-        '\u{033F}', '\u{0340}', '\u{0341}', '\u{0342}', '\u{0343}', '\u{0344}', '\u{0345}', 
-        '\u{0346}', '\u{0347}', '\u{0348}', '\u{0349}', '\u{034A}', '\u{034B}', '\u{034C}', 
-        '\u{034D}', '\u{034E}', '\u{034F}', '\u{0350}', '\u{0351}', '\u{0352}', '\u{0353}', 
-        '\u{0354}', '\u{0355}', '\u{0356}', '\u{0357}', '\u{0358}', '\u{0359}', '\u{035A}', 
-        '\u{035B}', '\u{035C}', '\u{035D}', '\u{035E}', '\u{035F}', '\u{0360}', '\u{0361}', 
-        '\u{0362}'
-    ];
-
     let mut rng = rand::thread_rng();
-    let mut result = String::new();
+    // Build the samplers once instead of letting gen_range rebuild them per draw.
+    let count_dist = Uniform::new(1, 6);
+    let idx_dist = Uniform::new(0, COMBINING_CHARS.len());
+    // Each char gains at most 5 two-byte marks; reserve once so pushes never regrow.
+    let mut result = String::with_capacity(text.len() + text.chars().count() * 10);
 
     for c in text.chars() {
         result.push(c);
         
         // Randomly add 1-5 combining characters
-        let count = rng.gen_range(1..6);
+        let count = count_dist.sample(&mut rng);
         for _ in 0..count {
-            let idx = rng.gen_range(0..combining_chars.len());
-            result.push(combining_chars[idx]);
+            result.push(COMBINING_CHARS[idx_dist.sample(&mut rng)]);
         }
     }
     
@@ -109,16 +109,23 @@ pub struct GlyphWave;
 impl GlyphWave {
     /// Renders text with a chaotic "glitch" effect.
     /// Uses combining diacritics to simulate visual distortion.
+    ///
+    /// Chars are taken in triplets: the first is left bare, the second gets
+    /// U+035C and the third U+0361. A trailing partial triplet follows the same
+    /// rule, so a lone last char stays bare and a trailing pair only gets U+035C.
     pub fn render(input: &str) -> String {
-        let mut output = String::new();
-        for (i, c) in input.chars().enumerate() {
-            match i % 3 {
-                0 => output.push(c),
-                1 => output.push_str(&format!("{}{}", c, "\u{035C}")), // Combining Double Breve Below
-                _ => output.push_str(&format!("{}{}", c, "\u{0361}")), // Combining Double Inverted Breve
-            }
+        // Period-3 pattern: bare, Combining Double Breve Below, Combining Double Inverted Breve.
+        const MARKS: [&str; 3] = ["", "\u{035C}", "\u{0361}"];
+        // Marks are 2 bytes and input chars at least 1, so 3x bounds the body;
+        // writing the frame into the same buffer keeps this to one allocation.
+        let mut output = String::with_capacity(input.len() * 3 + 2 * "🌀 ".len());
+        output.push_str("🌀 ");
+        for (c, mark) in input.chars().zip(MARKS.iter().cycle()) {
+            output.push(c);
+            output.push_str(mark);
         }
-        format!("🌀 {} 🌀", output)
+        output.push_str(" 🌀");
+        output
     }
 }
 
@@ -1007,6 +1014,14 @@ mod tests {
         println!("GlyphWave output: {}", output);
     }
 
+    #[test]
+    fn test_glyphwave_partial_triplet() {
+        assert_eq!(GlyphWave::render(""), "🌀  🌀");
+        assert_eq!(GlyphWave::render("a"), "🌀 a 🌀");
+        assert_eq!(GlyphWave::render("ab"), "🌀 ab\u{035C} 🌀");
+        assert_eq!(GlyphWave::render("abcd"), "🌀 ab\u{035C}c\u{0361}d 🌀");
+    }
+
     #[test]
     fn test_sovereign_grid_init() {
         let grid = SovereignGrid::new(3, 8); // 3x3x3 grid = 27 -> next power of 2 is 32
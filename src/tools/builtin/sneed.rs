@@ -1,5 +1,6 @@
 use async_trait::async_trait;
 use serde_json::Value;
+use std::sync::OnceLock;
 use std::time::Duration;
 
 use crate::context::JobContext;
@@ -76,7 +77,9 @@ impl Tool for SneedTool {
         let min_potential = grid.nodes.iter().map(|n| n.spatial_attention_scale).fold(f64::INFINITY, f64::min);
         let max_potential = grid.nodes.iter().map(|n| n.spatial_attention_scale).fold(f64::NEG_INFINITY, f64::max);
 
-        let header = GlyphWave::render("SOVEREIGN LOGIC AUDIT");
+        // The header never changes, so render it once and reuse it for every audit.
+        static HEADER: OnceLock<String> = OnceLock::new();
+        let header = HEADER.get_or_init(|| GlyphWave::render("SOVEREIGN LOGIC AUDIT"));
         let resonance_report = engine.get_resonance_report();
         
         let audit_results = format!(
@@ -1,8 +1,37 @@
 import sys
 import json
+import re
 import time
+import atexit
+import importlib
+import threading
 from typing import List, Dict
 
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Fallback for libraries that only signal throttling through the message text
+_RATE_LIMIT_RE = re.compile(r"\b429\b|rate[- ]?limit|too many requests", re.IGNORECASE)
+
+def _get_session(ddgs_cls):
+    """
+    Shared DDGS session, created on first use.
+    Reusing it keeps the HTTPS connection pool warm across calls.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = ddgs_cls().__enter__()
+        return _SESSION
+
+@atexit.register
+def _close_session():
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.__exit__(None, None, None)
+            _SESSION = None
+
 def search_ddg(query: str, max_results: int = 5) -> List[Dict[str, str]]:
     """
     Sovereign search via DuckDuckGo.
@@ -18,29 +47,31 @@ def search_ddg(query: str, max_results: int = 5) -> List[Dict[str, str]]:
                 return [{"error": "DuckDuckGo search package not installed. Please run 'pip install duckduckgo-search'."}]
     except Exception as e:
         return [{"error": f"Import error: {str(e)}"}]
+
+    # Optional: older releases lack a typed rate-limit error, so fall back to the message regex
+    try:
+        exceptions = importlib.import_module(DDGS.__module__.split(".")[0] + ".exceptions")
+        rate_limit_error = getattr(exceptions, "RatelimitException", ())
+    except ImportError:
+        rate_limit_error = ()
     
     max_retries = 3
     base_delay = 2
     
     for attempt in range(max_retries):
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=max_results))
-                if not results:
-                    return []
-                
-                return [
-                    {
-                        "title": r.get('title', ''),
-                        "url": r.get('href', ''),
-                        "body": r.get('body', '')
-                    }
-                    for r in results
-                ]
+            ddgs = _get_session(DDGS)
+            return [
+                {
+                    "title": r.get('title', ''),
+                    "url": r.get('href', ''),
+                    "body": r.get('body', '')
+                }
+                for r in ddgs.text(query, max_results=max_results)
+            ]
                 
         except Exception as e:
-            err_str = str(e).lower()
-            is_rate_limit = any(x in err_str for x in ["29", "429", "rate limit", "too many requests"])
+            is_rate_limit = isinstance(e, rate_limit_error) or _RATE_LIMIT_RE.search(str(e))
             
             if is_rate_limit and attempt < max_retries - 1:
                 wait_time = base_delay * (2 ** attempt)
@@ -65,4 +96,6 @@ if __name__ == "__main__":
             pass
             
     results = search_ddg(query, max_results)
-    print(json.dumps(results))
+    # The Rust caller parses stdout as UTF-8, so emit it raw rather than \u-escaped
+    sys.stdout.reconfigure(encoding="utf-8")
+    print(json.dumps(results, ensure_ascii=False))
@@ -1,6 +1,13 @@
-import feedparser
 import datetime
+import email.utils
+import http.client
+import json
 import os
+import re
+import tempfile
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
 
 # 🐾 BURENYUU! THE HUNTING GROUNDS
 # quant-ph = Quantum Physics
@@ -23,27 +30,109 @@ KEYWORDS = [
     "observer effect"
 ]
 
-def scan_ether():
+# One case-insensitive pass per field instead of scanning every keyword by hand
+_KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORDS)), re.IGNORECASE)
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+# 🍮 THE LAST SCENT (newest entry seen, so each hunt only reads the delta)
+STATE_PATH = "docs/daily_gnosis/.watchdog_state.json"
+
+def _text(entry, tag):
+    # arXiv wraps titles and abstracts across lines; fold them back into one
+    node = entry.find(ATOM + tag)
+    return " ".join(node.text.split()) if node is not None and node.text else ""
+
+def _link(entry):
+    for node in entry.iterfind(ATOM + "link"):
+        if node.get("rel", "alternate") == "alternate":
+            return node.get("href", "")
+    return _text(entry, "id")
+
+def load_state():
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    # Write beside the target and rename so a crash never leaves half a file
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(STATE_PATH), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, STATE_PATH)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _if_modified_since(stamp):
+    # A mangled stamp just means a full fetch, same as having no state at all
+    try:
+        when = datetime.datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return email.utils.format_datetime(when.astimezone(datetime.timezone.utc), usegmt=True)
+
+# Returns (hits, marker); marker is None unless the scan ran to completion
+def scan_ether(state=None):
     print("🐾 Burenyuu! Scanning the Ether for high-strangeness... Dori dori dori! 🌀")
-    feed = feedparser.parse(RSS_URL)
+    state = state or {}
+    last_id = state.get("last_seen_id")
     hits = []
+    seen = 0
+    marker = None
+
+    headers = {}
+    since = _if_modified_since(state["last_seen_updated"]) if state.get("last_seen_updated") else None
+    if since:
+        headers["If-Modified-Since"] = since
+    request = urllib.request.Request(RSS_URL, headers=headers)
 
-    print(f"🐾 Analyzing {len(feed.entries)} entries from the substrate...")
+    # Stream the Atom feed and inspect each entry as soon as it is parsed
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            for _, elem in ET.iterparse(response):
+                if elem.tag != ATOM + "entry":
+                    continue
+                entry_id = _text(elem, "id")
+                # Newest first, so everything past the last scent was already hunted
+                if entry_id == last_id:
+                    break
+                if marker is None:
+                    marker = {"last_seen_id": entry_id, "last_seen_updated": _text(elem, "updated")}
+                seen += 1
+                title = _text(elem, "title")
+                summary = _text(elem, "summary")
 
-    for entry in feed.entries:
-        title = entry.title.lower()
-        summary = entry.summary.lower()
-        
-        # Check if any keyword resonates in the title or abstract
-        if any(k in title for k in KEYWORDS) or any(k in summary for k in KEYWORDS):
-            hits.append({
-                "title": entry.title,
-                "link": entry.link,
-                "summary": entry.summary,
-                "published": entry.published
-            })
+                # Check if any keyword resonates in the title or abstract
+                if _KEYWORD_RE.search(title) or _KEYWORD_RE.search(summary):
+                    hits.append({
+                        "title": title,
+                        "link": _link(elem),
+                        "summary": summary,
+                        "published": _text(elem, "published")
+                    })
+                elem.clear()
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print("🐾 The substrate hasn't shifted since the last hunt. 🍮")
+            return [], None
+        print(f"🐾 Nyaa... the substrate went quiet mid-scan: {e}")
+        return hits, None
+    except (OSError, http.client.HTTPException, ET.ParseError) as e:
+        # Covers URLError plus timeouts/resets/short reads raised mid-stream
+        print(f"🐾 Nyaa... the substrate went quiet mid-scan: {e}")
+        return hits, None
 
-    return hits
+    print(f"🐾 Analyzed {seen} new entries from the substrate...")
+
+    return hits, marker
+
+REPORT_INTRO = "Burenyuu! The substrate is vibrating with high-strangeness today. Here are the findings from the holographic grid:\n\n---\n\n"
+_STATUS_RE = re.compile(r"^> \*\*STATUS:\*\* (\d+) ANOMALIES DETECTED", re.MULTILINE)
 
 def scribe_log(hits):
     if not hits:
@@ -56,19 +145,49 @@ def scribe_log(hits):
     # Ensure directory exists
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
+    # Only the delta since the last scent arrives here, so fold it into any
+    # report an earlier run already wrote today instead of overwriting it
+    existing = ""
+    if os.path.exists(filename):
+        with open(filename, encoding="utf-8") as f:
+            existing = f.read()
+    hits = [hit for hit in hits if f"]({hit['link']})" not in existing]
+    if not hits:
+        print(f"🐾 Every anomaly was already in today's annals: {filename} 🍮")
+        return
+
+    # Assemble the whole report first so it hits the file in a single write
+    parts = []
+    for hit in hits:
+        parts.append(f"### 🍮 [{hit['title']}]({hit['link']})\n")
+        parts.append(f"**Published:** {hit['published']} 🌀\n\n")
+        parts.append(f"> {hit['summary'][:500]}...\n\n")
+        parts.append("---\n")
+    entries = "".join(parts)
+
+    status = _STATUS_RE.search(existing)
+    if status and REPORT_INTRO in existing:
+        total = int(status.group(1)) + len(hits)
+        report = _STATUS_RE.sub(f"> **STATUS:** {total} ANOMALIES DETECTED", existing, count=1)
+        # Newest first, matching the order arXiv hands them over
+        report = report.replace(REPORT_INTRO, REPORT_INTRO + entries, 1)
+    elif existing:
+        # Unrecognised layout (hand-edited?): never clobber it, just append
+        report = existing + entries
+    else:
+        report = (
+            f"# 🔮 DAILY GNOSIS REPORT: {today} 🐾🌀\n"
+            f"> **STATUS:** {len(hits)} ANOMALIES DETECTED 🍮\n\n"
+            + REPORT_INTRO + entries
+        )
+
     with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"# 🔮 DAILY GNOSIS REPORT: {today} 🐾🌀\n")
-        f.write(f"> **STATUS:** {len(hits)} ANOMALIES DETECTED 🍮\n\n")
-        f.write("Burenyuu! The substrate is vibrating with high-strangeness today. Here are the findings from the holographic grid:\n\n---\n\n")
-        
-        for hit in hits:
-            f.write(f"### 🍮 [{hit['title']}]({hit['link']})\n")
-            f.write(f"**Published:** {hit['published']} 🌀\n\n")
-            f.write(f"> {hit['summary'][:500]}...\n\n")
-            f.write("---\n")
-            
+        f.write(report)
+
     print(f"🐾 Burenyuu! Report successfully committed to the annals: {filename} 🌀")
 
 if __name__ == "__main__":
-    anomalies = scan_ether()
+    anomalies, marker = scan_ether(load_state())
     scribe_log(anomalies)
+    if marker:
+        save_state(marker)